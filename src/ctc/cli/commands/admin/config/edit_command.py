@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import shlex
 import shutil
 import tempfile
 
@@ -43,6 +44,6 @@ def edit_config_command() -> None:
         config_data = json.load(f)
     with open(temppath, 'w') as f:
         json.dump(config_data, f, indent=4, sort_keys=True)
-    subprocess.call([editor, temppath])
+    subprocess.call(shlex.split(editor) + [temppath])
     shutil.copy2(temppath, config_path)
     print('done editing config')
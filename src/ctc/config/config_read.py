@@ -18,14 +18,27 @@ from . import upgrade_utils
 
 def get_config_path(*, raise_if_dne: bool = True) -> str:
 
-    config_path_env_var = config_spec.config_path_env_var
-    default_config_path = config_spec.default_config_path
-
     # get config_path from environmental variable
+    config_path_env_var = config_spec.config_path_env_var
     if config_path_env_var is not None:
         config_path = os.environ.get(config_path_env_var)
-        if config_path == '':
-            config_path = None
+    else:
+        config_path = None
+
+    return _get_config_path(config_path, raise_if_dne=raise_if_dne)
+
+
+@functools.lru_cache()
+def _get_config_path(
+    config_path: str | None,
+    *,
+    raise_if_dne: bool,
+) -> str:
+
+    default_config_path = config_spec.default_config_path
+
+    if config_path == '':
+        config_path = None
 
     # use default config path if not specified
     if config_path is None and default_config_path is not None:
@@ -85,10 +98,13 @@ def get_config(
 
     # convert int keys from str to int
     for key in spec.typedata.config_int_subkeys:
-        if raw_config.get(key) is not None:
+        subconfig = raw_config.get(key)
+        if subconfig is not None and not all(
+            type(chain_id) is int for chain_id in subconfig
+        ):
             raw_config[key] = {
                 int(chain_id): network_metadata
-                for chain_id, network_metadata in raw_config[key].items()
+                for chain_id, network_metadata in subconfig.items()
             }
 
     # load settings from env vars
@@ -134,5 +150,6 @@ def get_config_version_tuple(
 
 
 def reset_config_cache() -> None:
+    _get_config_path.cache_clear()
     get_config.cache_clear()
 
@@ -6,6 +6,9 @@ import typing
 from ctc import spec
 
 
+_config_key_set = frozenset(spec.config_keys)
+
+
 def get_config_validators() -> (
     typing.Mapping[str, None | typing.Callable[..., None]]
 ):
@@ -60,7 +63,7 @@ def validate_config(config: typing.Mapping[typing.Any, typing.Any]) -> None:
     # check that each entry is valid
     for key, value in config.items():
         # check that key is allowed
-        if key not in spec.config_keys:
+        if key not in _config_key_set:
             raise spec.ConfigInvalid('key not allowed in config: ' + str(key))
 
         # check value type
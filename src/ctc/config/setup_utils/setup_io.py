@@ -83,8 +83,6 @@ def write_new_config(
     headless: bool = False,
 ) -> None:
 
-    import json
-
     config_path = config_read.get_config_path(raise_if_dne=False)
 
     networks = {
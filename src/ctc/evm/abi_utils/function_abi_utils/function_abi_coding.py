@@ -140,10 +140,7 @@ def encode_function_parameters(
     # inefficient: convert prefix_hex binary to bytes
     new_parameters = []
     for parameter_type, parameter in zip(parameter_types, parameters):
-        if (
-            parameter_type == 'bytes32'
-            and binary_utils.get_binary_format(parameter) != 'binary'
-        ):
+        if parameter_type == 'bytes32' and not isinstance(parameter, bytes):
             parameter = binary_utils.to_binary(parameter)
         new_parameters.append(parameter)
     parameters = new_parameters
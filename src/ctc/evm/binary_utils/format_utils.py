@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import codecs
 import typing
 
 from ctc import spec
@@ -27,12 +26,12 @@ def get_binary_n_bytes(data: spec.GenericBinaryData) -> int:
     if isinstance(data, bytes):
         return len(data)
     elif isinstance(data, str):
-        if len(data) % 2 != 0:
+        if len(data) & 1:
             raise Exception('hex data must have even number of characters')
         if data.startswith('0x'):
-            return int(len(data) / 2) - 1
+            return (len(data) >> 1) - 1
         else:
-            return int(len(data) / 2)
+            return len(data) >> 1
     elif isinstance(data, int):
         # adapted from https://stackoverflow.com/a/30375198
         if data < 0:
@@ -92,7 +91,7 @@ def text_to_binary(
 
 def binary_to_text(binary: spec.GenericBinaryData) -> str:
     """convert binary data to text"""
-    return codecs.decode(binary_convert(binary, 'binary'))
+    return binary_convert(binary, 'binary').decode()
 
 
 @typing.overload
@@ -151,16 +150,35 @@ def binary_convert(
     if output_format is None:
         output_format = 'prefix_hex'
 
+    # fast path for most common conversions
+    if n_bytes is None:
+        if type(data) is bytes:
+            if output_format == 'prefix_hex':
+                return '0x' + data.hex()
+            elif output_format == 'integer':
+                return int.from_bytes(data, 'big')
+            elif output_format == 'raw_hex':
+                return data.hex()
+        elif (
+            type(data) is str
+            and output_format == 'binary'
+            and not len(data) & 1
+        ):
+            if data.startswith('0x'):
+                return bytes.fromhex(data[2:])
+            else:
+                return bytes.fromhex(data)
+
     if isinstance(data, str):
         if data.startswith('0x'):
             raw_data = data[2:]
         else:
             raw_data = data
 
-        if n_bytes is not None and len(raw_data) / 2 != n_bytes:
-            if len(raw_data) % 2 != 0:
+        if n_bytes is not None and len(raw_data) != 2 * n_bytes:
+            if len(raw_data) & 1:
                 raise Exception('incomplete byte representation')
-            input_bytes = int(len(raw_data) / 2)
+            input_bytes = len(raw_data) >> 1
             raw_data = '00' * (n_bytes - input_bytes) + raw_data
 
         if output_format == 'prefix_hex':
@@ -168,7 +186,7 @@ def binary_convert(
         elif output_format == 'raw_hex':
             return raw_data
         elif output_format == 'binary':
-            if len(raw_data) % 2 == 1:
+            if len(raw_data) & 1:
                 raw_data = '0' + raw_data
             return bytes.fromhex(raw_data)
         elif output_format == 'integer':
@@ -178,8 +196,8 @@ def binary_convert(
 
     elif isinstance(data, bytes):
 
-        if n_bytes is not None and len(data) != n_bytes:
-            data = b'0' * (n_bytes - len(data)) + data
+        if n_bytes is not None and len(data) < n_bytes:
+            data = bytes(n_bytes - len(data)) + data
 
         if output_format == 'binary':
             return data
@@ -206,7 +224,7 @@ def binary_convert(
             if keep_leading_0 is None:
                 keep_leading_0 = True
             if n_bytes is None:
-                n_bytes = get_binary_n_bytes(data)
+                n_bytes = (data.bit_length() + 7) >> 3
             as_bytes = data.to_bytes(n_bytes, 'big')
 
             if output_format == 'binary':
@@ -7,6 +7,11 @@ from ctc import spec
 from . import safe_spec
 
 
+_safe_transaction_keys_without_nonce = tuple(
+    key for key in safe_spec.safe_transaction_keys if key != 'nonce'
+)
+
+
 def parse_safe_signatures(
     signatures: spec.Data,
 ) -> typing.Sequence[typing.Mapping[str, typing.Any]]:
@@ -14,49 +19,55 @@ def parse_safe_signatures(
     reference: https://docs.gnosis-safe.io/contracts/signatures
     """
     as_bytes = evm.to_binary(signatures)
+    total = len(as_bytes)
 
-    eip_1271_positions = []
+    min_eip_1271_position: int | None = None
     eip_1271_indices = []
     s = 0
+    offset = 0
     parsed_signatures = []
     while True:
-        signature = as_bytes[:65]
-        as_bytes = as_bytes[65:]
+        signature = as_bytes[offset : offset + 65]
+        offset += 65
 
         assert len(signature) == 65
 
         signature_type = signature[-1]
-        if 31 > signature_type and signature_type > 26:
+        if 26 < signature_type < 31:
             parsed = {
                 'type': 'ecdsa',
-                'signature': evm.to_hex(signature),
-                'r': evm.binary_convert(signature[:32], 'integer'),
-                's': evm.binary_convert(signature[32:64], 'integer'),
-                'v': evm.binary_convert(signature_type, 'integer'),
+                'signature': '0x' + signature.hex(),
+                'r': int.from_bytes(signature[:32], 'big'),
+                's': int.from_bytes(signature[32:64], 'big'),
+                'v': signature_type,
             }
         elif signature_type > 30:
             parsed = {
                 'type': 'eth_sign',
-                'signature': evm.to_hex(signature),
-                'r': evm.binary_convert(signature[:32], 'integer'),
-                's': evm.binary_convert(signature[32:64], 'integer'),
-                'v': evm.binary_convert(signature_type - 4, 'integer'),
+                'signature': '0x' + signature.hex(),
+                'r': int.from_bytes(signature[:32], 'big'),
+                's': int.from_bytes(signature[32:64], 'big'),
+                'v': signature_type - 4,
             }
         elif signature_type == 0:
+            position = int.from_bytes(signature[32:64], 'big')
             parsed = {
                 'type': 'eip1271',
-                'signature': evm.to_hex(signature),
-                'verifier': evm.to_hex(signature[:32][-20:]),
-                'position': evm.binary_convert(signature[32:64], 'integer'),
+                'signature': '0x' + signature.hex(),
+                'verifier': '0x' + signature[12:32].hex(),
+                'position': position,
             }
-            position: int = typing.cast(int, parsed['position'])
-            eip_1271_positions.append(position)
+            if (
+                min_eip_1271_position is None
+                or position < min_eip_1271_position
+            ):
+                min_eip_1271_position = position
             eip_1271_indices.append(s)
         elif signature_type == 1:
             parsed = {
                 'type': 'prevalidated',
-                'signature': evm.to_hex(signature),
-                'validator': evm.to_hex(signature[:32][-20:]),
+                'signature': '0x' + signature.hex(),
+                'validator': '0x' + signature[12:32].hex(),
             }
         else:
             raise Exception('unknown signature type: ' + str(signature_type))
@@ -64,9 +75,12 @@ def parse_safe_signatures(
         parsed_signatures.append(parsed)
         s += 1
 
-        if len(as_bytes) == 0:
+        if offset >= total:
             break
-        if len(eip_1271_positions) > 0 and s * 65 >= min(eip_1271_positions):
+        if (
+            min_eip_1271_position is not None
+            and s * 65 >= min_eip_1271_position
+        ):
             break
 
     return parsed_signatures
@@ -129,13 +143,16 @@ def _get_safe_transaction_signers(
     else:
         raise Exception('unknown signatures format: ' + str(type(signatures)))
 
+    # convert hash once rather than once per recovered signature
+    message_hash = evm.to_binary(safe_transaction_hash)
+
     signers = []
     for signature in parsed_signatures:
 
-        if signature['type'] in ['ecdsa', 'eth_sign']:
+        if signature['type'] in ('ecdsa', 'eth_sign'):
             vrs = signature['v'], signature['r'], signature['s']
             signer = evm.recover_signer_address(
-                message_hash=safe_transaction_hash,
+                message_hash=message_hash,
                 signature=vrs,
             )
         elif signature['type'] == 'eip1271':
@@ -184,15 +201,13 @@ def get_safe_transaction_from_call_data(
         call_data=call_data,
         function_abi=safe_spec.function_abis['execTransaction'],
     )
-    parameters = typing.cast(
-        typing.Mapping[str, typing.Any], decoded['named_parameters']
-    )
+    parameters = decoded['named_parameters']
+    if parameters is None:
+        raise Exception('could not decode named parameters of call data')
 
     # create safe transaction from decoded transaction parameters
     safe_transaction: safe_spec.SafeTransaction = {  # type: ignore
-        key: parameters[key]
-        for key in safe_spec.safe_transaction_keys
-        if key != 'nonce'
+        key: parameters[key] for key in _safe_transaction_keys_without_nonce
     }
     safe_transaction['nonce'] = nonce
     return safe_transaction
@@ -208,8 +223,8 @@ def get_safe_signatures_from_call_data(
     )
 
     # return signatures
-    parameters = typing.cast(
-        typing.Mapping[str, typing.Any], decoded['named_parameters']
-    )
+    parameters = decoded['named_parameters']
+    if parameters is None:
+        raise Exception('could not decode named parameters of call data')
     raw_signatures = parameters['signatures']
     return parse_safe_signatures(raw_signatures)
@@ -4,7 +4,7 @@ range bounds are **inclusive** by default
 """
 from __future__ import annotations
 
-import math
+import itertools
 import typing
 
 if typing.TYPE_CHECKING:
@@ -27,7 +27,7 @@ def split(
     elif n_splits is not None:
 
         n_items = len(items)
-        items_per_split = math.floor(n_items / n_splits)
+        items_per_split = n_items // n_splits
 
         if exact and n_items != n_splits * items_per_split:
             raise Exception('n_splits does not exactly divide items')
@@ -50,7 +50,7 @@ def split(
 
     elif items_per_split is not None:
         n_items = len(items)
-        n_splits = math.ceil(n_items / items_per_split)
+        n_splits = -(-n_items // items_per_split)
         if exact and n_items != n_splits * items_per_split:
             raise Exception('n_splits does not exactly divide items')
         splits = []
@@ -260,22 +260,25 @@ def range_to_chunks(
     """
 
     # compute range bounds
+    bound_ends: typing.Iterable[int]
     if round_bounds:
         start_bound = (start // chunk_size) * chunk_size
         end_bound = ((end // chunk_size) + 1) * chunk_size
-        bounds = list(range(start_bound, end_bound + 1, chunk_size))
+        bounds = range(start_bound, end_bound + 1, chunk_size)
+        bound_ends = bounds[1:]
     else:
-        bounds = list(range(start, end + 1, chunk_size))
-        bounds.append(end + 1)
+        bounds = range(start, end + 1, chunk_size)
+        bound_ends = itertools.chain(bounds[1:], [end + 1])
 
     # create chunks
-    chunks = []
-    for bound_start, bound_end in zip(bounds[:-1], bounds[1:]):
-        if index:
-            chunk = [bound_start, bound_end]
-        else:
-            chunk = [bound_start, bound_end - 1]
-        chunks.append(chunk)
+    if index:
+        end_offset = 0
+    else:
+        end_offset = 1
+    chunks = [
+        [bound_start, bound_end - end_offset]
+        for bound_start, bound_end in zip(bounds, bound_ends)
+    ]
 
     # trim outer bounds if needed
     if trim_outer_bounds:
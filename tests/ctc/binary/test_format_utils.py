@@ -21,6 +21,7 @@ def test_get_binary_format(test):
     [
         ['0x1234', 2],
         ['1234', 2],
+        ['0x', 0],
         [bytes.fromhex('1234'), 2],
     ],
 )
@@ -39,6 +40,13 @@ conversion_tests = [
     [bytes.fromhex('1234'), 'raw_hex', {}, '1234'],
     [bytes.fromhex('1234'), 'prefix_hex', {}, '0x1234'],
     [bytes.fromhex('1234'), 'binary', {}, bytes.fromhex('1234')],
+    [bytes.fromhex('1234'), 'integer', {}, 0x1234],
+    ['0x234', 'binary', {}, bytes.fromhex('0234')],
+    [bytes.fromhex('1234'), 'prefix_hex', {'n_bytes': 4}, '0x00001234'],
+    [bytes.fromhex('1234'), 'binary', {'n_bytes': 3}, bytes.fromhex('001234')],
+    [0x1234, 'prefix_hex', {}, '0x1234'],
+    [0x123456, 'binary', {}, bytes.fromhex('123456')],
+    [0x1234, 'binary', {'n_bytes': 4}, bytes.fromhex('00001234')],
 ]
 
 
@@ -46,3 +54,15 @@ conversion_tests = [
 def test_convert(test):
     data, output_format, kwargs, target = test
     assert evm.binary_convert(data, output_format, **kwargs) == target
+
+
+def test_convert_incomplete_byte_representation():
+    with pytest.raises(Exception):
+        evm.binary_convert('0x123', 'prefix_hex', n_bytes=1)
+
+
+def test_convert_large_buffer_matches_bytes_hex():
+    data = bytes(range(256)) * 64
+    assert evm.binary_convert(data, 'prefix_hex') == '0x' + data.hex()
+    assert evm.binary_convert(data, 'raw_hex') == data.hex()
+    assert evm.binary_convert('0x' + data.hex(), 'binary') == data
@@ -114,6 +114,16 @@ def test_use_env_var_config_path(monkeypatch):
     assert config_path == actual
 
 
+def test_get_config_path_follows_env_var(monkeypatch):
+    # test that cached config paths are keyed by the CTC_CONFIG_PATH env var
+    for config_path in [create_temp_config_path(), create_temp_config_path()]:
+        monkeypatch.setenv('CTC_CONFIG_PATH', config_path)
+        actual = ctc.config.get_config_path(raise_if_dne=False)
+        assert config_path == actual
+        with pytest.raises(spec.ConfigDoesNotExist):
+            ctc.config.get_config_path()
+
+
 def test_ctc_setup__env_var_sets_config_path(monkeypatch):
     # test that ctc writes to the CTC_CONFIG_PATH env var
     config_path = create_temp_config_path()
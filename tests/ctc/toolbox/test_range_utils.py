@@ -5,6 +5,25 @@ import pytest
 from ctc.toolbox import range_utils
 
 
+# items, kwargs, target
+split_tests = [
+    (list(range(10)), {'n_splits': 3}, [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]),
+    (
+        list(range(10)),
+        {'items_per_split': 4},
+        [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]],
+    ),
+    (list(range(8)), {'items_per_split': 4}, [[0, 1, 2, 3], [4, 5, 6, 7]]),
+]
+
+
+@pytest.mark.parametrize('test', split_tests)
+def test_split(test):
+    items, kwargs, target = test
+    actual = range_utils.split(items, **kwargs)
+    assert [list(split) for split in actual] == target
+
+
 # given as tuples of (range, previous_queries, desired_output)
 range_gap_tests = [
     (